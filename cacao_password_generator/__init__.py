@@ -29,7 +29,7 @@ Example Usage:
     >>> strength = cpg.rating("MyPassword123!")  # Returns: "strong"
 """
 
-from .core import generate, generate_multiple
+from .core import generate, generate_multiple, generate_batch
 from .validate import validate, validate_detailed, check_password_meets_minimum_requirements
 from .rating import rating, detailed_rating, rate_password_strength
 from .config import load_config, get_default_config
@@ -46,6 +46,7 @@ __all__ = [
     # Core password generation
     "generate",
     "generate_multiple",
+    "generate_batch",
     
     # Password validation
     "validate", 
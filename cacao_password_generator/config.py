@@ -6,7 +6,9 @@ environment variables, and runtime overrides.
 """
 
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 
 
 # Default configuration values
@@ -25,6 +27,9 @@ ENV_PREFIX = 'CACAO_PW_'
 # Valid configuration keys
 VALID_CONFIG_KEYS = set(DEFAULT_CONFIG.keys())
 
+# Environment variable names, in DEFAULT_CONFIG order
+_ENV_KEYS = tuple(f"{ENV_PREFIX}{key.upper()}" for key in DEFAULT_CONFIG)
+
 
 def load_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
@@ -39,6 +44,80 @@ def load_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     Returns:
         Merged configuration dictionary
         
+    Raises:
+        ValueError: If invalid configuration keys are provided
+    """
+    return _build_config(config, _read_env_values())
+
+
+def load_frozen_config(config: Optional[Mapping[str, Any]] = None) -> Mapping[str, Any]:
+    """
+    Load configuration like load_config(), memoizing the result.
+    
+    Results are cached per (runtime config, environment variable values)
+    pair, so repeated calls with the same configuration skip merging and
+    validation. Configurations with unhashable or unsortable entries are
+    loaded without caching.
+    
+    Args:
+        config: Optional runtime configuration overrides
+        
+    Returns:
+        Read-only merged configuration mapping
+        
+    Raises:
+        ValueError: If invalid configuration keys are provided
+    """
+    env_values = _read_env_values()
+    
+    try:
+        # Include each value's type so that e.g. 8.0 never hits an entry cached for 8
+        items = tuple(sorted((k, type(v), v) for k, v in config.items())) if config else ()
+        return _normalize_frozen(items, env_values)
+    except TypeError:
+        return MappingProxyType(_build_config(config, env_values))
+
+
+@lru_cache(maxsize=32)
+def _normalize_frozen(items: Tuple[Tuple[str, type, Any], ...],
+                      env_values: Tuple[Optional[str], ...]) -> Mapping[str, Any]:
+    """
+    Build and freeze a configuration from hashable inputs (cached).
+    
+    Args:
+        items: Sorted runtime configuration (key, value type, value) triples
+        env_values: Raw environment variable values from _read_env_values()
+        
+    Returns:
+        Read-only merged configuration mapping
+    """
+    config = {key: value for key, _, value in items}
+    return MappingProxyType(_build_config(config, env_values))
+
+
+def _read_env_values() -> Tuple[Optional[str], ...]:
+    """
+    Read the raw environment variable overrides.
+    
+    Returns:
+        Tuple of environment variable values (None if unset), in DEFAULT_CONFIG order
+    """
+    environ = os.environ
+    return tuple(environ.get(env_key) for env_key in _ENV_KEYS)
+
+
+def _build_config(config: Optional[Mapping[str, Any]],
+                  env_values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """
+    Merge defaults, environment values and runtime overrides, then validate.
+    
+    Args:
+        config: Optional runtime configuration overrides
+        env_values: Raw environment variable values from _read_env_values()
+        
+    Returns:
+        Merged configuration dictionary
+        
     Raises:
         ValueError: If invalid configuration keys are provided
     """
@@ -46,9 +125,7 @@ def load_config(config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     merged_config = DEFAULT_CONFIG.copy()
     
     # Override with environment variables
-    for key in DEFAULT_CONFIG:
-        env_key = f"{ENV_PREFIX}{key.upper()}"
-        env_value = os.getenv(env_key)
+    for key, env_key, env_value in zip(DEFAULT_CONFIG, _ENV_KEYS, env_values):
         if env_value is not None:
             try:
                 # Convert environment variable to appropriate type
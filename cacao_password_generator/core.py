@@ -6,13 +6,13 @@ with configurable constraints and character requirements.
 """
 
 import secrets
-from typing import Dict, Any, Optional, List, Set
+from functools import lru_cache
+from typing import Dict, Any, Mapping, Optional, List, MutableSequence, Tuple
 
-from .config import load_config
+from .config import load_frozen_config
 from .utils import (
-    ALL_CHARS, UPPERCASE_CHARS, LOWERCASE_CHARS, DIGIT_CHARS, SPECIAL_CHARS,
-    get_required_chars_for_config, get_available_chars_for_config,
-    get_character_requirements
+    UPPERCASE_CHARS_B, LOWERCASE_CHARS_B, DIGIT_CHARS_B, SPECIAL_CHARS_B, ALL_CHAR_SETS_B,
+    get_available_bytes_for_config, get_character_requirements
 )
 
 
@@ -32,32 +32,14 @@ def generate(config: Optional[Dict[str, Any]] = None, *, length: Optional[int] =
         ValueError: If length parameter is invalid or configuration is invalid
     """
     # Load and validate configuration
-    final_config = load_config(config)
+    final_config = load_frozen_config(config)
     
     # Handle length parameter
     if length is not None:
-        if not isinstance(length, int) or length <= 0:
-            raise ValueError(f"Length must be a positive integer, got: {length}")
-        
-        # Override config with specific length
+        _check_length_override(final_config, length)
         target_length = length
-        
-        # Check if length allows meeting minimum character requirements
-        char_requirements = get_character_requirements(final_config)
-        min_chars_needed = sum(char_requirements.values())
-        
-        if length < min_chars_needed:
-            raise ValueError(
-                f"Length {length} is too short to meet minimum character requirements "
-                f"(need at least {min_chars_needed} characters)"
-            )
     else:
-        # Use config length constraints
-        min_length = final_config['minlen']
-        max_length = final_config['maxlen']
-        
-        # Choose random length within range
-        target_length = secrets.randbelow(max_length - min_length + 1) + min_length
+        target_length = _random_length(final_config)
     
     # Generate password that meets all requirements
     password = _generate_password_with_requirements(final_config, target_length)
@@ -65,7 +47,106 @@ def generate(config: Optional[Dict[str, Any]] = None, *, length: Optional[int] =
     return password
 
 
-def _generate_password_with_requirements(config: Dict[str, Any], length: int) -> str:
+def generate_batch(config: Optional[Dict[str, Any]] = None, n: int = 1,
+                   *, length: Optional[int] = None) -> List[str]:
+    """
+    Generate a batch of secure passwords sharing one configuration.
+    
+    The configuration is loaded and validated once, and the random bytes
+    for every password are drawn in one buffer per character class.
+    
+    Args:
+        config: Optional configuration dictionary. If None, uses defaults.
+        n: Number of passwords to generate (must be positive)
+        length: Optional length override for all passwords
+        
+    Returns:
+        List of generated passwords
+        
+    Raises:
+        ValueError: If n, the length parameter or the configuration is invalid
+    """
+    if not isinstance(n, int) or n <= 0:
+        raise ValueError(f"Count must be a positive integer, got: {n}")
+    
+    final_config = load_frozen_config(config)
+    
+    if length is not None:
+        _check_length_override(final_config, length)
+        lengths = [length] * n
+    else:
+        lengths = [_random_length(final_config) for _ in range(n)]
+    
+    char_requirements = get_character_requirements(final_config)
+    available_chars = get_available_bytes_for_config(final_config)
+    
+    # Draw the required characters of each type for all passwords at once
+    required_pools = [
+        (_select_random_bytes(ALL_CHAR_SETS_B[char_type], count * n), count)
+        for char_type, count in char_requirements.items() if count > 0
+    ]
+    required_total = sum(char_requirements.values())
+    
+    fill_lengths = [max(0, target_length - required_total) for target_length in lengths]
+    fill_pool = _select_random_bytes(available_chars, sum(fill_lengths))
+    
+    passwords = []
+    fill_offset = 0
+    for i, fill_length in enumerate(fill_lengths):
+        password = bytearray()
+        for pool, count in required_pools:
+            password += pool[i * count:(i + 1) * count]
+        password += fill_pool[fill_offset:fill_offset + fill_length]
+        fill_offset += fill_length
+        
+        _shuffle_list(password)
+        passwords.append(password.decode('ascii'))
+    
+    return passwords
+
+
+def _check_length_override(config: Mapping[str, Any], length: int) -> None:
+    """
+    Check that an explicit length is valid for the configuration.
+    
+    Args:
+        config: Validated configuration dictionary
+        length: Requested password length
+        
+    Raises:
+        ValueError: If length is not a positive integer or is too short to
+                    meet the minimum character requirements
+    """
+    if not isinstance(length, int) or length <= 0:
+        raise ValueError(f"Length must be a positive integer, got: {length}")
+    
+    # Check if length allows meeting minimum character requirements
+    char_requirements = get_character_requirements(config)
+    min_chars_needed = sum(char_requirements.values())
+    
+    if length < min_chars_needed:
+        raise ValueError(
+            f"Length {length} is too short to meet minimum character requirements "
+            f"(need at least {min_chars_needed} characters)"
+        )
+
+
+def _random_length(config: Mapping[str, Any]) -> int:
+    """
+    Choose a random length within the configured range.
+    
+    Args:
+        config: Validated configuration dictionary
+        
+    Returns:
+        Length between minlen and maxlen (inclusive)
+    """
+    min_length: int = config['minlen']
+    max_length: int = config['maxlen']
+    return secrets.randbelow(max_length - min_length + 1) + min_length
+
+
+def _generate_password_with_requirements(config: Mapping[str, Any], length: int) -> str:
     """
     Generate password that meets all character requirements.
     
@@ -77,77 +158,107 @@ def _generate_password_with_requirements(config: Dict[str, Any], length: int) ->
         Password string meeting all requirements
     """
     char_requirements = get_character_requirements(config)
-    available_chars = get_available_chars_for_config(config)
+    available_chars = get_available_bytes_for_config(config)
     
     # Step 1: Ensure minimum character requirements are met
-    required_chars = []
+    password = bytearray()
     
     # Add required uppercase characters
     if char_requirements['uppercase'] > 0:
-        required_chars.extend(
-            _select_random_chars(UPPERCASE_CHARS, char_requirements['uppercase'])
-        )
+        password += _select_random_bytes(UPPERCASE_CHARS_B, char_requirements['uppercase'])
     
     # Add required lowercase characters
     if char_requirements['lowercase'] > 0:
-        required_chars.extend(
-            _select_random_chars(LOWERCASE_CHARS, char_requirements['lowercase'])
-        )
+        password += _select_random_bytes(LOWERCASE_CHARS_B, char_requirements['lowercase'])
     
     # Add required digit characters
     if char_requirements['digits'] > 0:
-        required_chars.extend(
-            _select_random_chars(DIGIT_CHARS, char_requirements['digits'])
-        )
+        password += _select_random_bytes(DIGIT_CHARS_B, char_requirements['digits'])
     
     # Add required special characters
     if char_requirements['special'] > 0:
-        required_chars.extend(
-            _select_random_chars(SPECIAL_CHARS, char_requirements['special'])
-        )
+        password += _select_random_bytes(SPECIAL_CHARS_B, char_requirements['special'])
     
     # Step 2: Fill remaining positions with random characters
-    remaining_length = length - len(required_chars)
+    remaining_length = length - len(password)
     
     if remaining_length > 0:
-        additional_chars = _select_random_chars(available_chars, remaining_length)
-        required_chars.extend(additional_chars)
+        password += _select_random_bytes(available_chars, remaining_length)
     
     # Step 3: Shuffle the password to avoid predictable patterns
-    password_list = required_chars
-    _shuffle_list(password_list)
+    _shuffle_list(password)
     
-    return ''.join(password_list)
+    return password.decode('ascii')
 
 
-def _select_random_chars(char_set: Set[str], count: int) -> List[str]:
+@lru_cache(maxsize=None)
+def _translation_table(alphabet: bytes) -> Tuple[bytes, bytes]:
     """
-    Select random characters from a character set.
+    Build the lookup table used to map random bytes onto an alphabet.
+    
+    Byte values at or above the largest multiple of len(alphabet) would
+    bias the result towards the start of the alphabet, so they are
+    returned separately to be rejected.
     
     Args:
-        char_set: Set of available characters
+        alphabet: Bytes of available characters
+        
+    Returns:
+        Tuple of (256-byte translation table, bytes to reject)
+    """
+    size = len(alphabet)
+    limit = 256 - 256 % size
+    table = bytes(alphabet[b % size] for b in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def _select_random_bytes(alphabet: bytes, count: int) -> bytearray:
+    """
+    Select random characters from a byte alphabet.
+    
+    Draws a single buffer from secrets.token_bytes() and maps it onto the
+    alphabet with bytes.translate(), discarding biased bytes (rejection sampling).
+    
+    Args:
+        alphabet: Bytes of available characters
         count: Number of characters to select
         
     Returns:
-        List of randomly selected characters
+        Bytearray of randomly selected characters
     """
-    char_list = list(char_set)
-    return [secrets.choice(char_list) for _ in range(count)]
+    table, rejected = _translation_table(alphabet)
+    accepted = 256 - len(rejected)
+    
+    selected = bytearray()
+    while len(selected) < count:
+        needed = count - len(selected)
+        raw = secrets.token_bytes(-(-needed * 256 // accepted) + 8)
+        selected += raw.translate(table, rejected)
+    
+    del selected[count:]
+    return selected
 
 
-def _shuffle_list(items: List[str]) -> None:
+def _shuffle_list(items: MutableSequence[Any]) -> None:
     """
     Cryptographically secure in-place shuffle of list items.
     
-    Uses Fisher-Yates shuffle algorithm with secrets.randbelow()
-    for cryptographic security.
+    Orders the items by random 64-bit keys drawn in a single
+    secrets.token_bytes() call, so the permutation is computed by the
+    C-level sort rather than one secrets.randbelow() call per item.
+    Any ordering is equally likely unless two keys collide, which has a
+    probability of roughly len(items)**2 / 2**65.
     
     Args:
-        items: List to shuffle in-place
+        items: List (or bytearray) to shuffle in-place
     """
-    for i in range(len(items) - 1, 0, -1):
-        j = secrets.randbelow(i + 1)
-        items[i], items[j] = items[j], items[i]
+    count = len(items)
+    if count < 2:
+        return
+    
+    keys = memoryview(secrets.token_bytes(8 * count)).cast('Q')
+    order = sorted(range(count), key=keys.__getitem__)
+    items[:] = list(map(items.__getitem__, order))
 
 
 def generate_multiple(count: int, config: Optional[Dict[str, Any]] = None, 
@@ -169,7 +280,7 @@ def generate_multiple(count: int, config: Optional[Dict[str, Any]] = None,
     if not isinstance(count, int) or count <= 0:
         raise ValueError(f"Count must be a positive integer, got: {count}")
     
-    return [generate(config, length=length) for _ in range(count)]
+    return generate_batch(config, count, length=length)
 
 
 def get_password_character_distribution(password: str) -> Dict[str, int]:
@@ -196,7 +307,7 @@ def estimate_generation_time(config: Optional[Dict[str, Any]] = None) -> str:
     Returns:
         Human-readable string describing generation complexity
     """
-    final_config = load_config(config)
+    final_config = load_frozen_config(config)
     char_requirements = get_character_requirements(final_config)
     min_chars_needed = sum(char_requirements.values())
     
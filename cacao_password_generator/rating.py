@@ -2,7 +2,9 @@
 
 import math
 import re
-from typing import Dict, Any
+from array import array
+from bisect import bisect_right
+from typing import Dict, Any, List
 from .utils import categorize_characters, get_character_space_size
 
 # Rating thresholds
@@ -20,6 +22,21 @@ DIVERSITY_THRESHOLDS = {
     'excellent': 4
 }
 
+# log2 of every possible character set size (index 0 is unused)
+_LOG2 = array('d', [0.0] + [math.log2(i) for i in range(1, 257)])
+
+# Crack time units as (seconds, singular, plural), smallest first
+_TIME_UNITS = (
+    (1, "second", "seconds"),
+    (60, "minute", "minutes"),
+    (3600, "hour", "hours"),
+    (24 * 3600, "day", "days"),
+    (365.25 * 24 * 3600, "year", "years"),                 # 365.25 days
+    (365.25 * 24 * 3600 * 100, "century", "centuries"),    # 100 years
+    (365.25 * 24 * 3600 * 1000, "millennium", "millennia")  # 1000 years
+)
+_TIME_UNIT_SECONDS = tuple(unit[0] for unit in _TIME_UNITS)
+
 
 def calculate_entropy(password: str) -> float:
     """
@@ -50,7 +67,7 @@ def calculate_entropy(password: str) -> float:
         return 0.0
         
     # Calculate entropy: log2(charset_size^length)
-    entropy = len(password) * math.log2(charset_size)
+    entropy = len(password) * _LOG2[charset_size]
     return entropy
 
 
@@ -246,40 +263,21 @@ def format_crack_time(seconds: float) -> str:
     if seconds < 1:
         return "less than 1 second"
     
-    # Time unit conversions (largest to smallest)
-    units = [
-        ("millennia", 365.25 * 24 * 3600 * 1000),  # 1000 years
-        ("centuries", 365.25 * 24 * 3600 * 100),   # 100 years
-        ("years", 365.25 * 24 * 3600),             # 365.25 days
-        ("days", 24 * 3600),                       # 24 hours
-        ("hours", 3600),                           # 60 minutes
-        ("minutes", 60),                           # 60 seconds
-        ("seconds", 1)
-    ]
-    
-    parts = []
+    parts: List[str] = []
     remaining = seconds
+    upper = len(_TIME_UNITS)
     
-    for unit_name, unit_seconds in units:
-        if remaining >= unit_seconds:
-            value = int(remaining // unit_seconds)
-            if value > 0:
-                # Handle singular vs plural
-                if value == 1:
-                    unit_display = unit_name[:-1] if unit_name.endswith('s') else unit_name
-                    if unit_name == "centuries":
-                        unit_display = "century"
-                    elif unit_name == "millennia":
-                        unit_display = "millennium"
-                else:
-                    unit_display = unit_name
-                
-                parts.append(f"{value} {unit_display}")
-                remaining -= value * unit_seconds
-                
-                # Stop after 2 units for readability
-                if len(parts) == 2:
-                    break
+    # Take the largest unit that fits, then the largest smaller unit that fits
+    while len(parts) < 2:
+        index = bisect_right(_TIME_UNIT_SECONDS, remaining, 0, upper) - 1
+        if index < 0:
+            break
+        
+        unit_seconds, singular, plural = _TIME_UNITS[index]
+        value = int(remaining // unit_seconds)
+        parts.append(f"{value} {singular if value == 1 else plural}")
+        remaining -= value * unit_seconds
+        upper = index
     
     return ", ".join(parts) if parts else "less than 1 second"
 
@@ -7,7 +7,7 @@ used across the password generation, validation, and rating modules.
 
 import string
 import math
-from typing import Set, Dict, Any
+from typing import Set, Dict, Any, Mapping
 
 
 # Character sets
@@ -27,6 +27,50 @@ ALL_CHAR_SETS = {
 # Combined character set for password generation
 ALL_CHARS = UPPERCASE_CHARS | LOWERCASE_CHARS | DIGIT_CHARS | SPECIAL_CHARS
 
+# Byte alphabets for password generation (sorted for a stable ordering)
+UPPERCASE_CHARS_B = ''.join(sorted(UPPERCASE_CHARS)).encode('ascii')
+LOWERCASE_CHARS_B = ''.join(sorted(LOWERCASE_CHARS)).encode('ascii')
+DIGIT_CHARS_B = ''.join(sorted(DIGIT_CHARS)).encode('ascii')
+SPECIAL_CHARS_B = ''.join(sorted(SPECIAL_CHARS)).encode('ascii')
+ALL_CHARS_B = UPPERCASE_CHARS_B + LOWERCASE_CHARS_B + DIGIT_CHARS_B + SPECIAL_CHARS_B
+
+ALL_CHAR_SETS_B = {
+    'uppercase': UPPERCASE_CHARS_B,
+    'lowercase': LOWERCASE_CHARS_B,
+    'digits': DIGIT_CHARS_B,
+    'special': SPECIAL_CHARS_B
+}
+
+# Character class flags
+CLASS_UPPERCASE = 1
+CLASS_LOWERCASE = 2
+CLASS_DIGIT = 4
+CLASS_SPECIAL = 8
+
+# Byte value -> class flag lookup table (0 for unclassified and non-ASCII bytes).
+# It covers all 256 byte values so it can be passed to bytes.translate().
+_CHAR_CLASS = bytes(
+    (CLASS_UPPERCASE if chr(i) in UPPERCASE_CHARS else 0)
+    | (CLASS_LOWERCASE if chr(i) in LOWERCASE_CHARS else 0)
+    | (CLASS_DIGIT if chr(i) in DIGIT_CHARS else 0)
+    | (CLASS_SPECIAL if chr(i) in SPECIAL_CHARS else 0)
+    for i in range(256)
+)
+
+
+def classify(char: str) -> int:
+    """
+    Get the character class flag of a single character.
+    
+    Args:
+        char: Single character to classify
+        
+    Returns:
+        One of the CLASS_* flags, or 0 if the character is not in any set
+    """
+    code = ord(char)
+    return _CHAR_CLASS[code] if code < 128 else 0
+
 
 def categorize_characters(password: str) -> Dict[str, int]:
     """
@@ -43,25 +87,16 @@ def categorize_characters(password: str) -> Dict[str, int]:
         - 'special': count of special characters
         - 'other': count of characters not in standard sets
     """
+    # Non-ASCII characters are dropped here and counted as 'other' below
+    classes = password.encode('ascii', 'ignore').translate(_CHAR_CLASS)
+    
     counts = {
-        'uppercase': 0,
-        'lowercase': 0,
-        'digits': 0,
-        'special': 0,
-        'other': 0
+        'uppercase': classes.count(CLASS_UPPERCASE),
+        'lowercase': classes.count(CLASS_LOWERCASE),
+        'digits': classes.count(CLASS_DIGIT),
+        'special': classes.count(CLASS_SPECIAL)
     }
-    
-    for char in password:
-        if char in UPPERCASE_CHARS:
-            counts['uppercase'] += 1
-        elif char in LOWERCASE_CHARS:
-            counts['lowercase'] += 1
-        elif char in DIGIT_CHARS:
-            counts['digits'] += 1
-        elif char in SPECIAL_CHARS:
-            counts['special'] += 1
-        else:
-            counts['other'] += 1
+    counts['other'] = len(password) - sum(counts.values())
     
     return counts
 
@@ -184,6 +219,34 @@ def get_available_chars_for_config(config: Dict[str, Any]) -> Set[str]:
     return available_chars
 
 
+def get_available_bytes_for_config(config: Mapping[str, Any]) -> bytes:
+    """
+    Get the byte alphabet for password generation based on configuration.
+    
+    Byte counterpart of get_available_chars_for_config(), using the same
+    exclusion rules (negative minimum values exclude a character type).
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Bytes containing every character that can be used for password generation
+    """
+    alphabet = b''
+    
+    if config.get('minuchars', 1) >= 0:
+        alphabet += UPPERCASE_CHARS_B
+    if config.get('minlchars', 1) >= 0:
+        alphabet += LOWERCASE_CHARS_B
+    if config.get('minnumbers', 1) >= 0:
+        alphabet += DIGIT_CHARS_B
+    if config.get('minschars', 1) >= 0:
+        alphabet += SPECIAL_CHARS_B
+    
+    # Fall back to lowercase letters to avoid an empty alphabet
+    return alphabet or LOWERCASE_CHARS_B
+
+
 def validate_password_length(password: str, config: Dict[str, Any]) -> bool:
     """
     Validate if password length meets configuration requirements.
@@ -199,7 +262,7 @@ def validate_password_length(password: str, config: Dict[str, Any]) -> bool:
     return config.get('minlen', 0) <= length <= config.get('maxlen', float('inf'))
 
 
-def get_character_requirements(config: Dict[str, Any]) -> Dict[str, int]:
+def get_character_requirements(config: Mapping[str, Any]) -> Dict[str, int]:
     """
     Extract character requirements from configuration.
     
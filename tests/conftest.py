@@ -5,136 +5,180 @@ This module provides pytest fixtures that are used across multiple test modules
 to ensure consistent test data and setup.
 """
 
+import contextlib
+import io
 import os
+import random
+import subprocess
+import sys
 import pytest
-import tempfile
+from types import MappingProxyType
 from typing import Dict, Any, List
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 # Import the package modules we're testing
 import cacao_password_generator as cpg
-from cacao_password_generator.config import get_default_config
+from cacao_password_generator import cli
+from cacao_password_generator.config import DEFAULT_CONFIG, ENV_PREFIX, get_default_config
 from cacao_password_generator.utils import ALL_CHARS, UPPERCASE_CHARS, LOWERCASE_CHARS, DIGIT_CHARS, SPECIAL_CHARS
 
 
-@pytest.fixture
+# Every CACAO_* environment variable read by the package or set by these fixtures
+_CACAO_VARS = tuple(f"{ENV_PREFIX}{key.upper()}" for key in DEFAULT_CONFIG) + (
+    'CACAO_MIN_LENGTH',
+    'CACAO_MAX_LENGTH',
+    'CACAO_MIN_UPPERCASE',
+    'CACAO_MIN_LOWERCASE',
+    'CACAO_MIN_NUMBERS',
+    'CACAO_MIN_SPECIAL',
+    'CACAO_ALLOW_SYMBOLS',
+    'CACAO_ALLOW_SPACES'
+)
+
+
+# Test passwords grouped by expected strength
+_WEAK_PASSWORDS = (
+    '123',
+    'abc',
+    'password',
+    'ABCDEFG',
+    '1234567'
+)
+
+_MEDIUM_PASSWORDS = (
+    'Password1',
+    'MyPass123',
+    'Test@123',
+    'Secure99'
+)
+
+_STRONG_PASSWORDS = (
+    'MySecureP@ssw0rd!',
+    'Complex#Password123',
+    'Str0ng&Secure!Pass',
+    'Test!ng#Strong2023'
+)
+
+_EXCELLENT_PASSWORDS = (
+    'MyS3cur3P@ssw0rd!2023',
+    'C0mpl3x&V3ryStr0ng!P@ss',
+    'Exc3ll3nt#S3cur1ty!K3y$2024',
+    'Ultr@S3cur3!C0mpl3x&P@ssw0rd#'
+)
+
+# Password validation cases: (password, expected_valid, description)
+_VALIDATION_CASES = (
+    ('Abc123!', True, 'Valid password with all character types'),
+    ('abc', False, 'Too short, missing uppercase/numbers/special chars'),
+    ('ABCDEFGHIJ', False, 'Missing lowercase/numbers/special chars'),
+    ('password123', False, 'Missing uppercase/special chars'),
+    ('PASSWORD123!', False, 'Missing lowercase chars'),
+    ('MyPassword', False, 'Missing numbers/special chars'),
+    ('MyPassword123', False, 'Missing special chars'),
+    ('MyPassword!', False, 'Missing numbers'),
+    ('', False, 'Empty password'),
+    ('A1!', False, 'Too short even with all char types')
+)
+
+# Argument name -> values for tests parametrized in pytest_generate_tests
+_PARAMETRIZED_ARGS = {
+    'weak_password': _WEAK_PASSWORDS,
+    'medium_password': _MEDIUM_PASSWORDS,
+    'strong_password': _STRONG_PASSWORDS,
+    'excellent_password': _EXCELLENT_PASSWORDS,
+}
+
+
+@pytest.fixture(scope="session")
 def default_config():
     """Provide default configuration for tests."""
-    return get_default_config()
+    return MappingProxyType(get_default_config())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def custom_config():
     """Provide a custom configuration for testing."""
-    return {
+    return MappingProxyType({
         'minlen': 8,
         'maxlen': 12,
         'minuchars': 2,
         'minlchars': 2,
         'minnumbers': 1,
         'minschars': 1
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def strict_config():
     """Provide a strict configuration for testing edge cases."""
-    return {
+    return MappingProxyType({
         'minlen': 16,
         'maxlen': 20,
         'minuchars': 4,
         'minlchars': 4,
         'minnumbers': 3,
         'minschars': 2
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_config():
     """Provide minimal configuration for testing."""
-    return {
+    return MappingProxyType({
         'minlen': 4,
         'maxlen': 6,
         'minuchars': 1,
         'minlchars': 1,
         'minnumbers': 0,
         'minschars': 0
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_config():
     """Provide invalid configuration for testing error handling."""
-    return {
+    return MappingProxyType({
         'minlen': 10,
         'maxlen': 8,  # Invalid: max < min
         'minuchars': 2,
         'minlchars': 2,
         'minnumbers': 1,
         'minschars': 1
-    }
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_passwords():
     """Provide various test passwords for validation and rating tests."""
-    return {
-        'weak': [
-            '123',
-            'abc',
-            'password',
-            'ABCDEFG',
-            '1234567'
-        ],
-        'medium': [
-            'Password1',
-            'MyPass123',
-            'Test@123',
-            'Secure99'
-        ],
-        'strong': [
-            'MySecureP@ssw0rd!',
-            'Complex#Password123',
-            'Str0ng&Secure!Pass',
-            'Test!ng#Strong2023'
-        ],
-        'excellent': [
-            'MyS3cur3P@ssw0rd!2023',
-            'C0mpl3x&V3ryStr0ng!P@ss',
-            'Exc3ll3nt#S3cur1ty!K3y$2024',
-            'Ultr@S3cur3!C0mpl3x&P@ssw0rd#'
-        ]
-    }
-
-
-@pytest.fixture
-def validation_test_cases():
-    """Provide test cases for password validation."""
-    return [
-        # (password, expected_valid, description)
-        ('Abc123!', True, 'Valid password with all character types'),
-        ('abc', False, 'Too short, missing uppercase/numbers/special chars'),
-        ('ABCDEFGHIJ', False, 'Missing lowercase/numbers/special chars'),
-        ('password123', False, 'Missing uppercase/special chars'),
-        ('PASSWORD123!', False, 'Missing lowercase chars'),
-        ('MyPassword', False, 'Missing numbers/special chars'),
-        ('MyPassword123', False, 'Missing special chars'),
-        ('MyPassword!', False, 'Missing numbers'),
-        ('', False, 'Empty password'),
-        ('A1!', False, 'Too short even with all char types')
-    ]
+    return MappingProxyType({
+        'weak': _WEAK_PASSWORDS,
+        'medium': _MEDIUM_PASSWORDS,
+        'strong': _STRONG_PASSWORDS,
+        'excellent': _EXCELLENT_PASSWORDS
+    })
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def character_sets():
     """Provide character sets for testing."""
-    return {
-        'uppercase': UPPERCASE_CHARS,
-        'lowercase': LOWERCASE_CHARS,
-        'digits': DIGIT_CHARS,
-        'special': SPECIAL_CHARS,
-        'all': ALL_CHARS
-    }
+    return MappingProxyType({
+        'uppercase': frozenset(UPPERCASE_CHARS),
+        'lowercase': frozenset(LOWERCASE_CHARS),
+        'digits': frozenset(DIGIT_CHARS),
+        'special': frozenset(SPECIAL_CHARS),
+        'all': frozenset(ALL_CHARS)
+    })
+
+
+@contextlib.contextmanager
+def _set_cacao(env_vars: Dict[str, str]):
+    """Set CACAO_* environment variables, removing them again on exit."""
+    os.environ.update(env_vars)
+    try:
+        yield env_vars
+    finally:
+        for var in env_vars:
+            os.environ.pop(var, None)
 
 
 @pytest.fixture
@@ -151,21 +195,19 @@ def mock_env():
         'CACAO_ALLOW_SPACES': 'false'
     }
     
-    with patch.dict(os.environ, env_vars):
-        yield env_vars
+    with _set_cacao(env_vars) as env:
+        yield env
 
 
 @pytest.fixture
 def cli_command():
     """Provide CLI command for subprocess testing."""
-    import sys
-    
     # Use the module execution approach for testing
     return [sys.executable, '-m', 'cacao_password_generator.cli']
 
 
 @pytest.fixture
-def temp_config_file():
+def temp_config_file(tmp_path):
     """Create a temporary configuration file for testing."""
     config_content = """
 # Test configuration file
@@ -177,25 +219,14 @@ minnumbers = 2
 minschars = 1
 """
     
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-        f.write(config_content)
-        temp_file = f.name
-    
-    yield temp_file
-    
-    # Cleanup
-    try:
-        os.unlink(temp_file)
-    except OSError:
-        pass
+    config_file = tmp_path / "test.conf"
+    config_file.write_text(config_content)
+    return str(config_file)
 
 
 @pytest.fixture
 def cli_runner():
-    """Provide a CLI runner for testing command line interface."""
-    import subprocess
-    import sys
-    
+    """Provide a subprocess CLI runner for integration tests."""
     def run_cli(args: List[str], timeout: int = 10):
         """Run CLI command and return result."""
         cmd = [sys.executable, '-m', 'cacao_password_generator.cli'] + args
@@ -216,91 +247,148 @@ def cli_runner():
 
 
 @pytest.fixture
-def sample_generated_passwords():
-    """Generate sample passwords for testing."""
-    passwords = []
-    configs = [
+def cli_runner_inproc():
+    """Provide an in-process CLI runner that avoids spawning an interpreter."""
+    def run_cli(args: List[str]):
+        """Run cli.main() with patched argv and return (returncode, stdout, stderr)."""
+        out, err = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err), \
+                patch.object(sys, 'argv', ['cacao-pass'] + list(args)):
+            try:
+                cli.main()
+                returncode = 0
+            except SystemExit as e:
+                returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        return returncode, out.getvalue(), err.getvalue()
+    
+    return run_cli
+
+
+@pytest.fixture(scope="session")
+def sample_configs():
+    """Provide the configurations used for sample password generation."""
+    return (
         None,  # Default config
-        {'minlen': 8, 'maxlen': 10},
-        {'minlen': 12, 'maxlen': 16, 'minuchars': 3},
-        {'minlen': 6, 'maxlen': 8, 'minschars': 0}
-    ]
+        MappingProxyType({'minlen': 8, 'maxlen': 10}),
+        MappingProxyType({'minlen': 12, 'maxlen': 16, 'minuchars': 3}),
+        MappingProxyType({'minlen': 6, 'maxlen': 8, 'minschars': 0})
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_generated_passwords(sample_configs):
+    """
+    Generate sample passwords for testing, once per session.
+    
+    Returns a tuple of (password, config_index) pairs; the index refers
+    to the sample_configs fixture.
+    """
+    passwords = []
     
-    for config in configs:
-        for _ in range(3):  # Generate 3 passwords for each config
-            pwd = cpg.generate(config)
-            passwords.append((pwd, config))
+    for index, config in enumerate(sample_configs):
+        # Generate 3 passwords for each config
+        passwords.extend((pwd, index) for pwd in cpg.generate_batch(config, 3))
     
-    return passwords
+    return tuple(passwords)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def parametrized_configs():
     """Provide parametrized configurations for comprehensive testing."""
-    return [
+    return (
         # (config_name, config_dict)
         ('default', None),
-        ('minimal', {
+        ('minimal', MappingProxyType({
             'minlen': 4, 'maxlen': 6, 'minuchars': 1, 'minlchars': 1,
             'minnumbers': 0, 'minschars': 0
-        }),
-        ('balanced', {
+        })),
+        ('balanced', MappingProxyType({
             'minlen': 8, 'maxlen': 12, 'minuchars': 2, 'minlchars': 2,
             'minnumbers': 1, 'minschars': 1
-        }),
-        ('strict', {
+        })),
+        ('strict', MappingProxyType({
             'minlen': 12, 'maxlen': 16, 'minuchars': 3, 'minlchars': 3,
             'minnumbers': 2, 'minschars': 2
-        }),
-        ('no_symbols', {
+        })),
+        ('no_symbols', MappingProxyType({
             'minlen': 8, 'maxlen': 10, 'minuchars': 2, 'minlchars': 2,
             'minnumbers': 1, 'minschars': 0
-        })
-    ]
+        }))
+    )
 
 
 @pytest.fixture(autouse=True)
 def reset_environment():
-    """Reset environment variables before each test."""
-    # Store original environment
-    original_env = os.environ.copy()
+    """Reset cacao-related environment variables around each test."""
+    # Store and remove only the cacao-related environment variables
+    original_cacao = {k: os.environ[k] for k in _CACAO_VARS if k in os.environ}
+    for var in original_cacao:
+        del os.environ[var]
     
-    # Remove any cacao-related environment variables
-    cacao_vars = [k for k in os.environ.keys() if k.startswith('CACAO_')]
-    for var in cacao_vars:
+    yield
+    
+    # Drop anything the test added, then restore the original values
+    for var in _CACAO_VARS:
         os.environ.pop(var, None)
+    os.environ.update(original_cacao)
+
+
+class _DetRng:
+    """Deterministic stand-in for the secrets module used by core."""
     
-    yield
+    def __init__(self, seed: int = 0):
+        self._r = random.Random(seed)
+    
+    def seed(self, seed: int) -> None:
+        self._r.seed(seed)
     
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    def token_bytes(self, nbytes: int) -> bytes:
+        return bytes(self._r.getrandbits(8) for _ in range(nbytes))
+    
+    def choice(self, seq):
+        return seq[0] if seq else ''
+    
+    def randbelow(self, n: int) -> int:
+        return 0
 
 
 @pytest.fixture
 def mock_secrets():
     """Mock secrets module for deterministic testing when needed."""
-    with patch('cacao_password_generator.core.secrets') as mock_secrets:
-        # Set up deterministic behavior
-        mock_secrets.choice.side_effect = lambda seq: seq[0] if seq else ''
-        mock_secrets.randbelow.side_effect = lambda n: 0 if n > 0 else 0
-        yield mock_secrets
+    rng = _DetRng(0)
+    with patch.object(cpg.core, 'secrets', rng):
+        yield rng
 
 
 # Performance testing fixtures
-@pytest.fixture
+@pytest.fixture(scope="session")
 def performance_config():
     """Configuration for performance testing."""
-    return {
-        'generation_counts': [1, 10, 100, 1000],
-        'length_ranges': [(6, 8), (10, 12), (16, 20), (24, 32)],
-        'complexity_levels': [
-            {'minuchars': 1, 'minlchars': 1, 'minnumbers': 0, 'minschars': 0},
-            {'minuchars': 2, 'minlchars': 2, 'minnumbers': 1, 'minschars': 1},
-            {'minuchars': 4, 'minlchars': 4, 'minnumbers': 2, 'minschars': 2}
-        ]
-    }
+    return MappingProxyType({
+        'generation_counts': (1, 10, 100, 1000),
+        'length_ranges': ((6, 8), (10, 12), (16, 20), (24, 32)),
+        'complexity_levels': (
+            MappingProxyType({'minuchars': 1, 'minlchars': 1, 'minnumbers': 0, 'minschars': 0}),
+            MappingProxyType({'minuchars': 2, 'minlchars': 2, 'minnumbers': 1, 'minschars': 1}),
+            MappingProxyType({'minuchars': 4, 'minlchars': 4, 'minnumbers': 2, 'minschars': 2})
+        )
+    })
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize tests that request a single validation case or test password."""
+    if "validation_case" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "validation_case", _VALIDATION_CASES, ids=[case[2] for case in _VALIDATION_CASES]
+        )
+    
+    for argname, values in _PARAMETRIZED_ARGS.items():
+        if argname in metafunc.fixturenames:
+            metafunc.parametrize(argname, values)
+
 
+# Never import the demo script during collection
+collect_ignore = ["../playground.py"]
 
 # Markers for different test categories
 pytest_plugins = []
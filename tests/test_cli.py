@@ -6,14 +6,13 @@ This module tests the command-line interface functionality including:
 - Argument parsing and validation
 - Configuration building from CLI arguments  
 - Output formatting and display functions
-- CLI integration via subprocess
+- CLI integration via the in-process runner
 - Error handling and edge cases
 """
 
 import pytest
 import argparse
 import sys
-import subprocess
 import json
 import os
 from io import StringIO
@@ -506,107 +505,97 @@ class TestMainFunction:
 
 
 class TestCLIIntegration:
-    """Integration tests using subprocess to test the actual CLI."""
+    """End-to-end tests running the actual CLI entry point in-process."""
     
-    def test_cli_help(self, cli_command):
+    def test_cli_help(self, cli_runner_inproc):
         """Test CLI help output."""
-        result = subprocess.run([*cli_command, '--help'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--help'])
         
-        assert result.returncode == 0
-        assert 'Generate secure passwords' in result.stdout
-        assert 'Examples:' in result.stdout
+        assert returncode == 0
+        assert 'Generate secure passwords' in stdout
+        assert 'Examples:' in stdout
     
-    def test_cli_version(self, cli_command):
+    def test_cli_version(self, cli_runner_inproc):
         """Test CLI version output."""
-        result = subprocess.run([*cli_command, '--version'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--version'])
         
-        assert result.returncode == 0
-        assert 'cacao-pass' in result.stdout
+        assert returncode == 0
+        assert 'cacao-pass' in stdout
     
-    def test_cli_config_info(self, cli_command):
+    def test_cli_config_info(self, cli_runner_inproc):
         """Test CLI config info output."""
-        result = subprocess.run([*cli_command, '--config-info'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--config-info'])
         
-        assert result.returncode == 0
-        assert 'Cacao Password Generator' in result.stdout
-        assert 'Minimum length:' in result.stdout
-        assert 'Maximum length:' in result.stdout
+        assert returncode == 0
+        assert 'Cacao Password Generator' in stdout
+        assert 'Minimum length:' in stdout
+        assert 'Maximum length:' in stdout
     
-    def test_cli_basic_generation(self, cli_command):
+    def test_cli_basic_generation(self, cli_runner_inproc):
         """Test basic password generation."""
-        result = subprocess.run(cli_command, capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc([])
         
-        assert result.returncode == 0
-        assert 'Generated Password:' in result.stdout
-        assert 'Strength Rating:' in result.stdout
+        assert returncode == 0
+        assert 'Generated Password:' in stdout
+        assert 'Strength Rating:' in stdout
     
-    def test_cli_quiet_mode(self, cli_command):
+    def test_cli_quiet_mode(self, cli_runner_inproc):
         """Test CLI quiet mode."""
-        result = subprocess.run([*cli_command, '--quiet'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--quiet'])
         
-        assert result.returncode == 0
+        assert returncode == 0
         # In quiet mode, should only output the password
-        lines = [line.strip() for line in result.stdout.split('\n') if line.strip()]
+        lines = [line.strip() for line in stdout.split('\n') if line.strip()]
         assert len(lines) == 1
         assert len(lines[0]) >= 8  # Should be at least minimum length
     
-    def test_cli_rating_only_mode(self, cli_command):
+    def test_cli_rating_only_mode(self, cli_runner_inproc):
         """Test CLI rating-only mode."""
-        result = subprocess.run([*cli_command, '--rating-only', 'TestPassword123!'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--rating-only', 'TestPassword123!'])
         
-        assert result.returncode == 0
-        assert 'Password: TestPassword123!' in result.stdout
-        assert 'Strength:' in result.stdout
-        assert 'Validation:' in result.stdout
+        assert returncode == 0
+        assert 'Password: TestPassword123!' in stdout
+        assert 'Strength:' in stdout
+        assert 'Validation:' in stdout
     
     @pytest.mark.slow
-    def test_cli_multiple_generation(self, cli_command):
+    def test_cli_multiple_generation(self, cli_runner_inproc):
         """Test multiple password generation."""
-        result = subprocess.run([*cli_command, '--multiple', '3'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--multiple', '3'])
         
-        assert result.returncode == 0
-        assert 'Password 1:' in result.stdout
-        assert 'Password 2:' in result.stdout
-        assert 'Password 3:' in result.stdout
+        assert returncode == 0
+        assert 'Password 1:' in stdout
+        assert 'Password 2:' in stdout
+        assert 'Password 3:' in stdout
     
-    def test_cli_length_override(self, cli_command):
+    def test_cli_length_override(self, cli_runner_inproc):
         """Test CLI with length override."""
-        result = subprocess.run([*cli_command, '--length', '20', '--quiet'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--length', '20', '--quiet'])
         
-        assert result.returncode == 0
-        password = result.stdout.strip()
+        assert returncode == 0
+        password = stdout.strip()
         assert len(password) == 20
     
-    def test_cli_character_exclusions(self, cli_command):
+    def test_cli_character_exclusions(self, cli_runner_inproc):
         """Test CLI with character exclusions."""
-        result = subprocess.run([*cli_command, '--no-symbols', '--quiet'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--no-symbols', '--quiet'])
         
-        assert result.returncode == 0
-        password = result.stdout.strip()
+        assert returncode == 0
+        password = stdout.strip()
         # Should not contain common symbols
         symbols = "!@#$%^&*()_+{}|:\"<>?[]\\;'.,/"
         assert not any(char in symbols for char in password)
     
-    def test_cli_invalid_arguments(self, cli_command):
+    def test_cli_invalid_arguments(self, cli_runner_inproc):
         """Test CLI error handling with invalid arguments."""
-        result = subprocess.run([*cli_command, '--length', '-5'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--length', '-5'])
         
-        assert result.returncode == 1
-        assert 'Error:' in result.stderr
+        assert returncode == 1
+        assert 'Error:' in stderr
     
-    def test_cli_conflicting_arguments(self, cli_command):
+    def test_cli_conflicting_arguments(self, cli_runner_inproc):
         """Test CLI error handling with conflicting arguments."""
-        result = subprocess.run([*cli_command, '--no-uppercase', '--min-upper', '2'], 
-                              capture_output=True, text=True)
+        returncode, stdout, stderr = cli_runner_inproc(['--no-uppercase', '--min-upper', '2'])
         
-        assert result.returncode == 1
-        assert 'Error:' in result.stderr
\ No newline at end of file
+        assert returncode == 1
+        assert 'Error:' in stderr
\ No newline at end of file
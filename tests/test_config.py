@@ -11,6 +11,7 @@ from unittest.mock import patch, MagicMock
 
 from cacao_password_generator.config import (
     load_config,
+    load_frozen_config,
     get_default_config,
     get_config_from_env,
     _validate_config,
@@ -202,6 +203,49 @@ class TestLoadConfig:
         assert config['minschars'] == -1
 
 
+class TestLoadFrozenConfig:
+    """Test memoized configuration loading."""
+    
+    def test_matches_load_config(self):
+        """Test that the frozen config equals the load_config() result."""
+        config = {'minlen': 10, 'maxlen': 14, 'minschars': 0}
+        assert dict(load_frozen_config(config)) == load_config(config)
+        assert dict(load_frozen_config()) == load_config()
+    
+    def test_result_is_cached_and_read_only(self):
+        """Test that equal configs share one read-only result."""
+        first = load_frozen_config({'minlen': 9, 'maxlen': 12})
+        second = load_frozen_config({'maxlen': 12, 'minlen': 9})
+        
+        assert first is second
+        with pytest.raises(TypeError):
+            first['minlen'] = 1
+    
+    def test_environment_changes_are_respected(self):
+        """Test that the cache is keyed on environment variable values."""
+        with patch.dict(os.environ, {'CACAO_PW_MINLEN': '8'}):
+            assert load_frozen_config()['minlen'] == 8
+        with patch.dict(os.environ, {'CACAO_PW_MINLEN': '9'}):
+            assert load_frozen_config()['minlen'] == 9
+        assert load_frozen_config()['minlen'] == DEFAULT_CONFIG['minlen']
+    
+    def test_cached_int_does_not_admit_equal_float(self):
+        """Test that a float value never reuses an entry cached for an equal int."""
+        load_frozen_config({'minlen': 8})
+        
+        with pytest.raises(ValueError, match="must be an integer"):
+            load_frozen_config({'minlen': 8.0})
+    
+    def test_invalid_config_raises(self):
+        """Test that invalid configurations still raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid configuration keys"):
+            load_frozen_config({'bogus': 1})
+        with pytest.raises(ValueError, match="must be an integer"):
+            load_frozen_config({'minlen': [8]})
+        with pytest.raises(ValueError, match="cannot be greater than maxlen"):
+            load_frozen_config({'minlen': 20, 'maxlen': 10})
+
+
 class TestConfigValidation:
     """Test configuration validation logic."""
     
@@ -7,6 +7,7 @@ character distribution analysis, and generation time estimation.
 
 import pytest
 import re
+import struct
 from typing import Dict, Any
 from unittest.mock import patch
 
@@ -76,6 +77,20 @@ class TestGenerate:
         with pytest.raises(ValueError, match="too short to meet minimum character requirements"):
             core.generate(strict_config, length=10)
     
+    def test_generate_with_deterministic_rng(self, mock_secrets, custom_config):
+        """Test that a deterministic RNG always picks the minimum length."""
+        password = core.generate(custom_config)
+        
+        assert len(password) == custom_config['minlen']
+    
+    def test_generate_reproducible_with_deterministic_rng(self, mock_secrets, custom_config):
+        """Test that reseeding the deterministic RNG reproduces the password."""
+        first = core.generate(custom_config)
+        mock_secrets.seed(0)
+        second = core.generate(custom_config)
+        
+        assert first == second
+    
     @pytest.mark.parametrize("config", [
         None,
         {'minlen': 8, 'maxlen': 12},
@@ -182,6 +197,56 @@ class TestGenerateMultiple:
         assert len(set(passwords)) >= 95  # Very high uniqueness expected
 
 
+class TestGenerateBatch:
+    """Test the generate_batch() function."""
+    
+    def test_generate_batch_default(self):
+        """Test batch generation with default settings."""
+        passwords = core.generate_batch(n=10)
+        
+        assert isinstance(passwords, list)
+        assert len(passwords) == 10
+        assert all(6 <= len(pwd) <= 16 for pwd in passwords)
+    
+    def test_generate_batch_meets_requirements(self, custom_config):
+        """Test that every password in a batch meets the configuration."""
+        passwords = core.generate_batch(custom_config, 25)
+        
+        for password in passwords:
+            assert custom_config['minlen'] <= len(password) <= custom_config['maxlen']
+            char_dist = categorize_characters(password)
+            assert char_dist['uppercase'] >= custom_config['minuchars']
+            assert char_dist['lowercase'] >= custom_config['minlchars']
+            assert char_dist['digits'] >= custom_config['minnumbers']
+            assert char_dist['special'] >= custom_config['minschars']
+    
+    def test_generate_batch_with_length(self):
+        """Test batch generation with length override."""
+        passwords = core.generate_batch(n=5, length=20)
+        
+        assert all(len(pwd) == 20 for pwd in passwords)
+        assert len(set(passwords)) == 5
+    
+    def test_generate_batch_respects_exclusions(self):
+        """Test that excluded character types never appear in a batch."""
+        config = {'minschars': -1, 'minnumbers': -1}
+        passwords = core.generate_batch(config, 20, length=12)
+        
+        for password in passwords:
+            char_dist = categorize_characters(password)
+            assert char_dist['special'] == 0
+            assert char_dist['digits'] == 0
+    
+    def test_generate_batch_invalid_arguments(self, strict_config):
+        """Test error handling for invalid batch arguments."""
+        with pytest.raises(ValueError, match="Count must be a positive integer"):
+            core.generate_batch(n=0)
+        with pytest.raises(ValueError, match="Length must be a positive integer"):
+            core.generate_batch(n=2, length=0)
+        with pytest.raises(ValueError, match="too short to meet minimum character requirements"):
+            core.generate_batch(strict_config, 2, length=10)
+
+
 class TestPasswordCharacterDistribution:
     """Test password character distribution analysis."""
     
@@ -265,17 +330,38 @@ class TestEstimateGenerationTime:
 class TestInternalFunctions:
     """Test internal helper functions."""
     
-    @patch('cacao_password_generator.core.secrets')
-    def test_select_random_chars(self, mock_secrets):
-        """Test _select_random_chars function."""
-        mock_secrets.choice.side_effect = lambda seq: seq[0]  # Always return first char
+    @patch('cacao_password_generator.core.secrets.token_bytes')
+    def test_select_random_bytes(self, mock_token_bytes):
+        """Test _select_random_bytes function."""
+        mock_token_bytes.side_effect = lambda n: bytes(range(n))
         
-        char_set = {'a', 'b', 'c'}
-        result = core._select_random_chars(char_set, 3)
+        result = core._select_random_bytes(b'abc', 5)
         
-        assert len(result) == 3
-        assert all(char in char_set for char in result)
-        assert mock_secrets.choice.call_count == 3
+        assert result == bytearray(b'abcab')
+        assert mock_token_bytes.call_count == 1
+    
+    @patch('cacao_password_generator.core.secrets.token_bytes')
+    def test_select_random_bytes_rejects_biased_bytes(self, mock_token_bytes):
+        """Test that bytes above the largest multiple of the alphabet size are rejected."""
+        # 256 % 3 == 1, so byte 255 must be discarded
+        draws = iter([b'\xff' * 20, b'\x01' * 20])
+        mock_token_bytes.side_effect = lambda n: next(draws)
+        
+        result = core._select_random_bytes(b'abc', 3)
+        
+        assert result == bytearray(b'bbb')
+        assert mock_token_bytes.call_count == 2
+    
+    def test_translation_table(self):
+        """Test _translation_table maps every byte onto the alphabet."""
+        table, rejected = core._translation_table(b'abc')
+        
+        assert len(table) == 256
+        assert set(table) == set(b'abc')
+        assert rejected == b'\xff'
+        
+        # Power-of-two alphabets need no rejection
+        assert core._translation_table(b'abcd')[1] == b''
     
     def test_shuffle_list(self):
         """Test _shuffle_list function."""
@@ -312,6 +398,17 @@ class TestInternalFunctions:
         single_list = ['a']
         core._shuffle_list(single_list)
         assert single_list == ['a']
+    
+    @patch('cacao_password_generator.core.secrets.token_bytes')
+    def test_shuffle_list_orders_by_random_keys(self, mock_token_bytes):
+        """Test that _shuffle_list orders items by keys from one random draw."""
+        mock_token_bytes.return_value = struct.pack('=4Q', 3, 1, 0, 2)
+        
+        items = bytearray(b'abcd')
+        core._shuffle_list(items)
+        
+        assert items == bytearray(b'cbda')
+        mock_token_bytes.assert_called_once_with(32)
 
 
 class TestEdgeCases:
@@ -213,6 +213,7 @@ class TestConfigurationIntegration:
             pass
 
 
+@pytest.mark.integration
 class TestCLIIntegration:
     """Test CLI integration with full command execution."""
     
@@ -467,6 +468,7 @@ class TestVersionAndMetadata:
         version_pattern = r'^\d+\.\d+\.\d+.*'
         assert re.match(version_pattern, version), f"Invalid version format: {version}"
     
+    @pytest.mark.integration
     def test_cli_version_consistency(self, cli_command):
         """Test CLI version matches package version."""
         result = subprocess.run([*cli_command, '--version'],
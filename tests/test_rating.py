@@ -156,6 +156,46 @@ class TestBasicRating:
         assert result in ["medium", "strong"]
 
 
+# Shared test passwords whose rating() differs from their group. rating() is
+# entropy based: 7+ letters of one case clear the 30-bit 'medium' threshold,
+# 8+ characters from three or more types clear the 50-bit 'strong' threshold,
+# and 16+ character passwords get a length bonus that makes them 'excellent'.
+_RATING_EXCEPTIONS = {
+    'password': 'medium',
+    'ABCDEFG': 'medium',
+    'Password1': 'strong',
+    'MyPass123': 'strong',
+    'Test@123': 'strong',
+    'MySecureP@ssw0rd!': 'excellent',
+    'Complex#Password123': 'excellent',
+    'Str0ng&Secure!Pass': 'excellent',
+    'Test!ng#Strong2023': 'excellent',
+}
+
+
+class TestSharedPasswordRatings:
+    """Test ratings of the shared test passwords."""
+    
+    def test_weak_password_rating(self, weak_password):
+        """Test the rating of each weak password."""
+        expected = _RATING_EXCEPTIONS.get(weak_password, 'weak')
+        assert rating(weak_password) == expected
+    
+    def test_medium_password_rating(self, medium_password):
+        """Test the rating of each medium password."""
+        expected = _RATING_EXCEPTIONS.get(medium_password, 'medium')
+        assert rating(medium_password) == expected
+    
+    def test_strong_password_rating(self, strong_password):
+        """Test the rating of each strong password."""
+        expected = _RATING_EXCEPTIONS.get(strong_password, 'strong')
+        assert rating(strong_password) == expected
+    
+    def test_excellent_password_rating(self, excellent_password):
+        """Test that excellent passwords rate excellent."""
+        assert rating(excellent_password) == 'excellent'
+
+
 class TestDiversityScoring:
     """Test character diversity scoring functionality."""
     
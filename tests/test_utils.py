@@ -23,11 +23,19 @@ from cacao_password_generator.utils import (
     SPECIAL_CHARS,
     ALL_CHAR_SETS,
     ALL_CHARS,
+    ALL_CHARS_B,
+    LOWERCASE_CHARS_B,
+    CLASS_UPPERCASE,
+    CLASS_LOWERCASE,
+    CLASS_DIGIT,
+    CLASS_SPECIAL,
+    classify,
     categorize_characters,
     get_character_space_size,
     calculate_entropy,
     get_required_chars_for_config,
     get_available_chars_for_config,
+    get_available_bytes_for_config,
     validate_password_length,
     get_character_requirements
 )
@@ -192,6 +200,26 @@ class TestCharacterCategorization:
                 assert count == 0
 
 
+class TestClassify:
+    """Test single-character class lookup."""
+    
+    def test_classify_matches_character_sets(self):
+        """Test that classify() agrees with the character set constants."""
+        for char in UPPERCASE_CHARS:
+            assert classify(char) == CLASS_UPPERCASE
+        for char in LOWERCASE_CHARS:
+            assert classify(char) == CLASS_LOWERCASE
+        for char in DIGIT_CHARS:
+            assert classify(char) == CLASS_DIGIT
+        for char in SPECIAL_CHARS:
+            assert classify(char) == CLASS_SPECIAL
+    
+    @pytest.mark.parametrize("char", [' ', '?', '~', '\t', 'é', 'ñ', '🔒'])
+    def test_classify_unclassified(self, char):
+        """Test that characters outside the standard sets classify as 0."""
+        assert classify(char) == 0
+
+
 class TestCharacterSpaceSize:
     """Test character space size calculation."""
     
@@ -517,6 +545,37 @@ class TestAvailableCharsForConfig:
         assert result == expected
 
 
+class TestAvailableBytesForConfig:
+    """Test byte alphabet calculation from configuration."""
+    
+    def test_empty_config_includes_all(self):
+        """Test that empty config yields the full byte alphabet."""
+        assert get_available_bytes_for_config({}) == ALL_CHARS_B
+        assert set(ALL_CHARS_B.decode('ascii')) == ALL_CHARS
+    
+    @pytest.mark.parametrize("config", [
+        {},
+        {'minuchars': -1},
+        {'minlchars': -1, 'minschars': -1},
+        {'minuchars': 2, 'minlchars': -1, 'minnumbers': 0, 'minschars': -1},
+    ])
+    def test_matches_available_chars(self, config):
+        """Test that the byte alphabet matches get_available_chars_for_config()."""
+        result = get_available_bytes_for_config(config)
+        assert set(result.decode('ascii')) == get_available_chars_for_config(config)
+        assert len(result) == len(set(result))
+    
+    def test_exclude_all_falls_back_to_lowercase(self):
+        """Test that excluding all types falls back to lowercase."""
+        config = {
+            'minuchars': -1,
+            'minlchars': -1,
+            'minnumbers': -1,
+            'minschars': -1
+        }
+        assert get_available_bytes_for_config(config) == LOWERCASE_CHARS_B
+
+
 class TestPasswordLengthValidation:
     """Test password length validation against configuration."""
     
@@ -132,6 +132,18 @@ class TestBasicValidation:
         assert errors == []
 
 
+class TestValidationCases:
+    """Test validation against the shared validation cases."""
+    
+    def test_validation_case(self, validation_case):
+        """Test that each shared case validates as expected with defaults."""
+        password, expected_valid, description = validation_case
+        is_valid, errors = validate(password)
+        
+        assert is_valid is expected_valid, description
+        assert (errors == []) is expected_valid
+
+
 class TestLengthValidation:
     """Test length validation helper function."""
     